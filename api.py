@@ -0,0 +1,56 @@
+# 进程内调用接口，可直接嵌入数据流水线，无需通过命令行启动
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Union
+
+from core.registry import Registry
+from core.data_model import UnifiedLabel
+from formats.base import BaseReader
+from utils import load_category_map
+# 引入所有格式插件，触发注册
+import formats
+
+def open_reader(
+        fmt: str,
+        label_path: Union[Path, str],
+        image_path: Optional[Union[Path, str]] = None,
+        category_map: Optional[Union[Dict[int, str], Path, str]] = None
+        ) -> BaseReader:
+    """
+    打开指定格式的标注数据集
+    :param fmt: 源数据格式，如 yolo, coco, voc
+    :param label_path: 源标签文件路径(文件夹或具体文件)
+    :param image_path: 源图片路径
+    :param category_map: 类别映射字典，或 category_map.yaml 的路径
+    :return: Reader 对象，可惰性迭代，支持切片与批量索引
+    """
+    if fmt not in Registry.READERS:
+        raise ValueError(f"Unsupported source format: '{fmt}'. Available: {list(Registry.READERS)}")
+
+    if isinstance(category_map, (str, Path)):
+        category_map = load_category_map(str(category_map))
+
+    reader_cls = Registry.READERS[fmt]
+    return reader_cls(
+        Path(label_path),
+        Path(image_path) if image_path is not None else None,
+        category_map or {}
+        )
+
+def convert(
+        labels: Iterable[UnifiedLabel],
+        dst_fmt: str,
+        dst_path: Union[Path, str]
+        ):
+    """
+    将统一标签流写出为目标格式
+    :param labels: 任意 UnifiedLabel 可迭代对象(Reader、切片结果、生成器等)
+    :param dst_fmt: 目标数据格式
+    :param dst_path: 输出保存路径
+    :return: Writer.write 的返回值
+    """
+    if dst_fmt not in Registry.WRITERS:
+        raise ValueError(f"Unsupported target format: '{dst_fmt}'. Available: {list(Registry.WRITERS)}")
+
+    writer_cls = Registry.WRITERS[dst_fmt]
+    writer = writer_cls(Path(dst_path))
+    return writer.write(labels)
@@ -0,0 +1 @@
+# pytest 会将该文件所在目录(项目根目录)加入 sys.path，使 tests/ 可以直接导入 core、formats 等模块
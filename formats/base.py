@@ -1,8 +1,9 @@
 # 定义抽象的基类
 
+import operator
 from pathlib import Path
 from abc import ABC, abstractmethod
-from typing import Iterator, Optional, Union
+from typing import Iterable, Iterator, List, Optional, Union
 from core.data_model import UnifiedLabel
 
 class BaseReader(ABC):  # 不可实例化，只能被继承
@@ -14,14 +15,52 @@ class BaseReader(ABC):  # 不可实例化，只能被继承
         pass 
 
     @abstractmethod
-    def __getitem__(self, idx: int) -> UnifiedLabel:
+    def _get_item(self, idx: int) -> Optional[UnifiedLabel]:
+        """ 读取单个样本，idx 已经过边界检查且非负 """
         pass
 
+    def _check_index(self, idx) -> int:
+        """ 校验整数索引并转换为非负索引 """
+        try:
+            pos = operator.index(idx)
+        except TypeError:
+            raise TypeError(f"Reader indices must be integers, slices or sequences of integers, not {type(idx).__name__}")
+
+        num = len(self)
+        if pos < 0:
+            pos += num
+        if pos < 0 or pos >= num:
+            raise IndexError(f"Index {idx} out of range for {num} samples")
+        return pos
+
+    def __getitem__(self, idx: Union[int, slice, Iterable[int]]) -> Union[Optional[UnifiedLabel], List[Optional[UnifiedLabel]]]:
+        """
+        根据索引获取标注数据
+        :param idx: 整数索引、切片或整数索引序列(批量读取)
+        :return: 整数索引返回单个 UnifiedLabel；切片与批量索引返回与索引一一对应的列表。
+                 无法解析的样本均以 None 占位，Writer 会跳过 None，结果可直接传给 Writer
+        """
+        if isinstance(idx, slice):
+            indices = range(*idx.indices(len(self)))
+        elif hasattr(idx, '__iter__') and not isinstance(idx, (str, bytes)):
+            indices = [self._check_index(i) for i in idx]
+        else:
+            return self._get_item(self._check_index(idx))
+
+        return [self._get_item(i) for i in indices]
+
+    def __iter__(self) -> Iterator[UnifiedLabel]:
+        """ 惰性逐个读取样本，跳过无法解析的样本(None) """
+        for idx in range(len(self)):
+            label = self._get_item(idx)
+            if label is not None:
+                yield label
+
 class BaseWriter(ABC):
     def __init__(self, output_path: Union[Path, str], **kwargs):
         self.output_path = Path(output_path)
 
     @abstractmethod
-    def write(self, labels: Iterator[UnifiedLabel]):
-        """接收统一数据模型流，写入文件"""
+    def write(self, labels: Iterable[UnifiedLabel]):
+        """接收统一数据模型流(任意可迭代对象)，写入文件"""
         pass
\ No newline at end of file
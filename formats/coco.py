@@ -11,7 +11,7 @@ import json
 from tqdm import tqdm
 from collections import defaultdict
 from pathlib import Path
-from typing import List, Dict, Optional, Iterator, Union
+from typing import List, Dict, Optional, Iterable, Union
 
 from formats.base import BaseReader, BaseWriter
 from core.registry import Registry
@@ -23,15 +23,15 @@ class CocoReader(BaseReader):
     def __init__(
                 self, 
                 label_dir: Union[Path, str], 
-                image_dir: Optional[Union[Path, str]], 
-                categories_map: Optional[Dict[int, str]]
+                image_dir: Optional[Union[Path, str]] = None, 
+                categories_map: Optional[Dict[int, str]] = None
                 ):
         self.label_dir = Path(label_dir)
         if image_dir is not None:
             self.image_dir = Path(image_dir)
         else:
-            self.image_dir = label_dir.parent / 'images'
-        self.categories_map = categories_map
+            self.image_dir = self.label_dir.parent / 'images'
+        self.categories_map = categories_map or {}
 
         # 获取目录下所有的 JSON 文件
         if self.label_dir.is_file() and self.label_dir.suffix == '.json':
@@ -108,7 +108,7 @@ class CocoReader(BaseReader):
         
         print(f"[CocoReader] Loaded {len(self.samples)} images.")
 
-    def __getitem__(self, idx):
+    def _get_item(self, idx: int):
         sample = self.samples[idx]
 
         return UnifiedLabel(
@@ -122,8 +122,9 @@ class CocoReader(BaseReader):
 
 @Registry.register_writer("coco")
 class CocoWriter(BaseWriter):
-    def __init__(self, output_path: Path):
+    def __init__(self, output_path: Union[Path, str]):
         super().__init__(output_path)
+        output_path = self.output_path
         if output_path.suffix == '.json':
             self.annotation_path = output_path
             self.output_dir = output_path.parent
@@ -134,10 +135,10 @@ class CocoWriter(BaseWriter):
         if not self.output_dir.exists():
             self.output_dir.mkdir(parents=True, exist_ok=True)
             
-    def write(self, labels: Iterator[UnifiedLabel]):
+    def write(self, labels: Iterable[UnifiedLabel]):
         """
         转换成COCO格式的标注文件
-        labels: Iterator[UnifiedLabel]
+        labels: Iterable[UnifiedLabel]，可以是 Reader、列表或惰性生成器，None 会被跳过
         """
         images = []
         annotations = []
@@ -149,13 +150,15 @@ class CocoWriter(BaseWriter):
         # 计数器
         ann_id_counter = 1
         
-        # 逐个图像生成COCO格式数据
-        label_list = list(labels)
-        for img_id, label in tqdm(enumerate(label_list, start=1), total=len(label_list), desc="Exporting COCO"):
+        # 逐个图像生成COCO格式数据(流式遍历，不预先物化整个数据集)
+        for label in tqdm(labels, desc="Exporting COCO"):
+            if label is None:
+                continue
+            img_id = len(images) + 1
             # 1. 构建 Image 信息
             # 如果 label 中没有文件名，生成一个数字文件名
             if label.image_path:
-                file_name = label.image_path.name
+                file_name = Path(label.image_path).name
             else:
                 file_name = f"{img_id:06d}.jpg"
                 
@@ -20,7 +20,7 @@ from tqdm import tqdm
 import xml.etree.ElementTree as ET
 from pathlib import Path
 from xml.dom import minidom
-from typing import List, Dict, Optional, Iterator, Union
+from typing import List, Dict, Optional, Iterable, Union
 
 from formats.base import BaseReader, BaseWriter
 from core.registry import Registry
@@ -32,29 +32,25 @@ class VocReader(BaseReader):
     def __init__(
             self, 
             label_dir: Union[Path, str], 
-            image_dir: Optional[Union[Path, str]], 
-            categories_map: Optional[Dict[int, str]]
+            image_dir: Optional[Union[Path, str]] = None, 
+            categories_map: Optional[Dict[int, str]] = None
             ):
-        self.label_dir = label_dir
+        self.label_dir = Path(label_dir)
         if image_dir is not None:
-            self.image_dir = image_dir
+            self.image_dir = Path(image_dir)
         else:
-            self.image_dir = label_dir.parent / 'images'
+            self.image_dir = self.label_dir.parent / 'images'
         self.files = get_files(label_dir, '.xml')
-        self.categories_map = {v: k for k, v in categories_map.items()}
+        self.categories_map = {v: k for k, v in (categories_map or {}).items()}
 
     def __len__(self):
         return len(self.files)
     
-    def __getitem__(self, idx: int):
+    def _get_item(self, idx: int):
         """
         根据索引获取单个标注数据
         """
-        if idx >= len(self.files):
-            raise IndexError(f"Index {idx} out of range for {len(self.files)} files")
-        
-        file = self.files[idx]
-        file = Path(file)
+        file = Path(self.files[idx])
         return self._process(file)
 
     def _process(self, file: Path):
@@ -76,8 +72,11 @@ class VocReader(BaseReader):
             w = int(img_size.find('width').text)
             h = int(img_size.find('height').text)
         else:
-            img = cv2.imread(img_path)
-            h, w, _ = img.shape
+            # 没有 size 信息时读取图像获取宽高，图像不存在或无法读取则跳过
+            img = cv2.imread(str(img_path))
+            if img is None:
+                return None
+            h, w = img.shape[:2]
         
         bboxes = []
         # 解析object标签中的bbox信息
@@ -97,9 +96,9 @@ class VocReader(BaseReader):
 
 @Registry.register_writer("voc")
 class VocWriter(BaseWriter):
-    def __init__(self, output_path: Path):
+    def __init__(self, output_path: Union[Path, str]):
         super().__init__(output_path)
-        self.output_dir = output_path
+        self.output_dir = self.output_path
         if not self.output_dir.is_dir():
             self.output_dir.mkdir(parents=True, exist_ok=True)
     
@@ -109,26 +108,27 @@ class VocWriter(BaseWriter):
         reparsed = minidom.parseString(rough_string)
         return reparsed.toprettyxml(indent="  ")
     
-    def write(self, labels):
+    def write(self, labels: Iterable[UnifiedLabel]):
         """
         将UnifiedLabel列表转换为VOC格式的标注文件
-        labels: Iterator[UnifiedLabel]
+        labels: Iterable[UnifiedLabel]，可以是 Reader、列表或惰性生成器，None 会被跳过
         """
         # 逐个图像生成VOC格式的标注文件
-        num = len(labels.files)
-        for label in tqdm(labels, total=num, desc="Converting to VOC format"):
+        for label in tqdm(labels, desc="Converting to VOC format"):
+            if label is None:
+                continue
+            image_path = Path(label.image_path)
             # file_name = os.path.basename(label.image_path)
             # xml_file = os.path.splitext(file_name)[0] + '.xml'
             # save_path = os.path.join(self.output_dir, xml_file)
-            file_name = label.image_path.stem
-            xml_file = file_name + '.xml'
+            xml_file = image_path.stem + '.xml'
             save_path = self.output_dir / xml_file
             
 
             root = ET.Element("annotation")
-            ET.SubElement(root, "folder").text = label.image_path.parent.name
-            ET.SubElement(root, "filename").text = file_name
-            ET.SubElement(root, "path").text = str(label.image_path)
+            ET.SubElement(root, "folder").text = image_path.parent.name
+            ET.SubElement(root, "filename").text = image_path.name
+            ET.SubElement(root, "path").text = str(image_path)
 
             for bbox in label.bboxes:
                 obj = ET.SubElement(root, "object")
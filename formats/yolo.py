@@ -5,7 +5,7 @@ import os
 import cv2
 from tqdm import tqdm
 from pathlib import Path
-from typing import List, Dict, Optional, Iterator, Union
+from typing import List, Dict, Optional, Iterable, Union
 
 from formats.base import BaseReader, BaseWriter
 from core.registry import Registry
@@ -17,31 +17,27 @@ class YoloReader(BaseReader):
     def __init__(
             self, 
             label_dir: Union[Path, str], 
-            image_dir: Optional[Union[Path, str]], 
-            categories_map: Optional[Dict[int, str]]
+            image_dir: Optional[Union[Path, str]] = None, 
+            categories_map: Optional[Dict[int, str]] = None
             ):
-        self.label_dir = label_dir
+        self.label_dir = Path(label_dir)
         if image_dir is not None:
-            self.image_dir = image_dir
+            self.image_dir = Path(image_dir)
         else:
-            self.image_dir = label_dir.parent / 'images'
+            self.image_dir = self.label_dir.parent / 'images'
         self.files = get_files(label_dir, '.txt')
-        self.categories_map = categories_map
+        self.categories_map = categories_map or {}
     
     def __len__(self):
         return len(self.files)
 
-    def __getitem__(self, idx: int):
+    def _get_item(self, idx: int):
         """
         根据索引获取单个标注数据
         """
-        if idx >= len(self.files):
-            raise IndexError(f"Index {idx} out of range for {len(self.files)} files")
-        
-        file = self.files[idx]
-        file = Path(file)
+        file = Path(self.files[idx])
         return self._process(file)
-        
+
 
     def _process(self, file: Path):
         """
@@ -78,21 +74,22 @@ class YoloReader(BaseReader):
         
 @Registry.register_writer("yolo")
 class YoloWriter(BaseWriter):
-    def __init__(self, output_path: Path):
+    def __init__(self, output_path: Union[Path, str]):
         super().__init__(output_path)
-        self.output_dir = output_path
+        self.output_dir = self.output_path
         if not self.output_dir.is_dir():
             self.output_dir.mkdir(parents=True, exist_ok=True)
     
-    def write(self, labels):
+    def write(self, labels: Iterable[UnifiedLabel]):
         """
         将UnifiedLabel列表转换为YOLO格式的标注文件
-        labels: Iterator[UnifiedLabel]
+        labels: Iterable[UnifiedLabel]，可以是 Reader、列表或惰性生成器，None 会被跳过
         """
         # 逐个图像生成YOLO格式的标注文件
-        labels = list(labels)
-        for label in tqdm(labels, total=len(labels), desc="Converting to YOLO format"):
-            file_name = label.image_path.stem
+        for label in tqdm(labels, desc="Converting to YOLO format"):
+            if label is None:
+                continue
+            file_name = Path(label.image_path).stem
             txt_file = file_name + '.txt'
             save_path = self.output_dir / txt_file
             
@@ -2,10 +2,8 @@
 import argparse
 from pathlib import Path
 
-from core.registry import Registry
+from api import open_reader, convert
 from utils import load_category_map
-# 引入所有格式插件，触发注册
-import formats
 
 def parse_args():
     parser = argparse.ArgumentParser(description="Label Format Converter")
@@ -32,16 +30,11 @@ def main():
     print(f"Loaded {len(cat_map)} categories.")
 
     # 2. 初始化 Reader
-    reader_cls = Registry.READERS[args.src_fmt]
-    reader = reader_cls(i_lab, i_img, cat_map)
+    reader = open_reader(args.src_fmt, i_lab, i_img, cat_map)
 
-    # 3. 初始化 Writer
-    writer_cls = Registry.WRITERS[args.dst_fmt]
-    writer = writer_cls(o_lab)
-
-    # 4. 执行转换
+    # 3. 执行转换
     print("Starting conversion...")
-    writer.write(reader)
+    convert(reader, args.dst_fmt, o_lab)
     print("Done.")
 
 if __name__ == "__main__":
@@ -0,0 +1,144 @@
+# api.open_reader / api.convert 与 Reader 索引行为的单元测试
+import json
+from pathlib import Path
+
+import cv2
+import numpy as np
+import pytest
+
+from api import open_reader, convert
+
+CATEGORY_MAP = {0: 'cat', 1: 'dog'}
+
+
+@pytest.fixture
+def yolo_dir(tmp_path):
+    """ 构造 4 个 YOLO 标注，其中 1.txt 没有对应图像 """
+    label_dir = tmp_path / 'labels'
+    image_dir = tmp_path / 'images'
+    label_dir.mkdir()
+    image_dir.mkdir()
+    for i in range(4):
+        (label_dir / f'{i}.txt').write_text(f'{i % 2} 0.5 0.5 0.2 0.4\n')
+        if i != 1:
+            cv2.imwrite(str(image_dir / f'{i}.jpg'), np.zeros((100, 200, 3), np.uint8))
+    return label_dir, image_dir
+
+
+@pytest.fixture
+def reader(yolo_dir):
+    label_dir, image_dir = yolo_dir
+    return open_reader('yolo', str(label_dir), str(image_dir), CATEGORY_MAP)
+
+
+def _stems(labels):
+    return sorted(label.image_path.stem for label in labels)
+
+
+def _index_of(reader, stem):
+    """ get_files 不保证文件顺序，按文件名查找索引 """
+    return next(i for i, f in enumerate(reader.files) if Path(f).stem == stem)
+
+
+def test_int_index(reader):
+    assert len(reader) == 4
+    label = reader[_index_of(reader, '0')]
+    assert (label.image_width, label.image_height) == (200, 100)
+    bbox = label.bboxes[0]
+    assert (bbox.xmin, bbox.ymin, bbox.xmax, bbox.ymax) == pytest.approx((80, 30, 120, 70))
+
+
+def test_negative_index(reader):
+    assert reader[-1] == reader[len(reader) - 1]
+    assert reader[_index_of(reader, '1') - len(reader)] is None
+
+
+@pytest.mark.parametrize('idx', [4, -5])
+def test_index_out_of_range(reader, idx):
+    with pytest.raises(IndexError, match=f"Index {idx} out of range"):
+        reader[idx]
+
+
+@pytest.mark.parametrize('idx', ['ab', b'ab', 1.0, None])
+def test_invalid_index_type(reader, idx):
+    with pytest.raises(TypeError):
+        reader[idx]
+
+
+def test_iter_skips_unreadable(reader):
+    assert _stems(reader) == ['0', '2', '3']
+
+
+def test_slice_and_batch_keep_positions(reader):
+    missing = _index_of(reader, '1')
+    batch = reader[:]
+    assert len(batch) == 4
+    assert batch[missing] is None
+    assert _stems(label for label in batch if label is not None) == ['0', '2', '3']
+    assert len(reader[::2]) == 2 and len(reader[1::2]) == 2
+
+    first, third = _index_of(reader, '0'), _index_of(reader, '2')
+    picked = reader[[third - len(reader), missing, first]]
+    assert [label.image_path.stem if label else None for label in picked] == ['2', None, '0']
+
+
+def test_batch_out_of_range(reader):
+    with pytest.raises(IndexError):
+        reader[[0, 10]]
+
+
+def test_convert_slice_to_coco(reader, tmp_path):
+    # 切片中无法解析的样本为 None，由 Writer 跳过
+    batch = reader[:]
+    out = convert(batch, 'coco', tmp_path / 'out.json')
+    with open(out, encoding='utf-8') as f:
+        data = json.load(f)
+    assert [img['file_name'] for img in data['images']] == [l.image_path.name for l in batch if l is not None]
+    assert [img['id'] for img in data['images']] == [1, 2, 3]
+    assert [ann['image_id'] for ann in data['annotations']] == [1, 2, 3]
+
+
+def test_convert_generator_to_yolo(reader, tmp_path):
+    out_dir = tmp_path / 'yolo_out'
+    convert((label for label in reader), 'yolo', str(out_dir))
+    assert sorted(p.stem for p in out_dir.iterdir()) == ['0', '2', '3']
+    cls_id, cx, cy, w, h = (out_dir / '0.txt').read_text().split()
+    assert int(cls_id) == 0
+    assert [float(v) for v in (cx, cy, w, h)] == pytest.approx([0.5, 0.5, 0.2, 0.4])
+
+
+def test_voc_without_size_skips_unreadable(yolo_dir, tmp_path):
+    _, image_dir = yolo_dir
+    voc_dir = tmp_path / 'voc'
+    voc_dir.mkdir()
+    # 缺少 size 信息时需要读取图像获取宽高，1.jpg 不存在
+    for stem in ('0', '1'):
+        (voc_dir / f'{stem}.xml').write_text(
+            f'<annotation><filename>{stem}.jpg</filename>'
+            '<object><name>dog</name><bndbox>'
+            '<xmin>10</xmin><ymin>20</ymin><xmax>30</xmax><ymax>40</ymax>'
+            '</bndbox></object></annotation>'
+        )
+
+    voc_reader = open_reader('voc', voc_dir, image_dir, CATEGORY_MAP)
+    assert voc_reader[_index_of(voc_reader, '1')] is None
+    labels = list(voc_reader)
+    assert _stems(labels) == ['0']
+    assert (labels[0].image_width, labels[0].image_height) == (200, 100)
+    assert labels[0].bboxes[0].cls_id == 1
+
+
+def test_voc_roundtrip(reader, yolo_dir, tmp_path):
+    _, image_dir = yolo_dir
+    out_dir = tmp_path / 'voc_out'
+    convert(reader[:], 'voc', out_dir)
+    assert sorted(p.stem for p in out_dir.iterdir()) == ['0', '2', '3']
+
+    voc_reader = open_reader('voc', out_dir, image_dir, CATEGORY_MAP)
+    labels = sorted(voc_reader, key=lambda label: label.image_path.stem)
+    assert [label.image_path.name for label in labels] == ['0.jpg', '2.jpg', '3.jpg']
+    for label in labels:
+        assert (label.image_width, label.image_height) == (200, 100)
+        bbox = label.bboxes[0]
+        assert (bbox.xmin, bbox.ymin, bbox.xmax, bbox.ymax) == (80, 30, 120, 70)
+        assert bbox.cls_id == int(label.image_path.stem) % 2